@@ -41,7 +41,8 @@ def main(freq_range: tuple,
     U_amp, U_phase, u, us = generator.get_multi_signals(m=m, 
                                                         p=p, 
                                                         nr_inputs=nr_inputs,
-                                                        mode=mode)
+                                                        mode=mode,
+                                                        verbose=True)
     t_stamp = generator.get_time_stamp(f, N*p*m)
 
     data = {
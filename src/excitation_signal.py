@@ -1,10 +1,14 @@
 """Classes for generating the excitation signals
 with random phases in the frequency domain.
 """
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 from tqdm import tqdm
 
-np.random.seed(42)
+# fallback L2 cache size when it cannot be queried from the system
+L2_CACHE_SIZE = 256 * 1024
 
 class ExcitationSignal():
     """Generate m different excitation signals with 
@@ -15,7 +19,9 @@ class ExcitationSignal():
                  f: float=100.0, 
                  N: int=100, 
                  amp: int=100.0,
-                 eps=1e-1) -> None:
+                 eps=1e-1,
+                 dtype: type=np.float32,
+                 seed: int=42) -> None:
         """Initializa a instance.
 
         Args:
@@ -23,7 +29,10 @@ class ExcitationSignal():
             f (flaot): The sampling frequency.
             N (int): The number of points for each signal.
             amp (float): Amplitude of the signal.
-            eps (float): The tolerance.
+            eps (float): The tolerance of |u[0] - u[1]|, enforced relative to the RMS 
+                of the signal, which is a conservative bound for the normalized signals.
+            dtype (type): The floating point precision of the signals.
+            seed (int): The seed of the random phase generator, or a np.random.Generator.
         """
         self.freq_range = freq_range
         self.f = f
@@ -31,6 +40,11 @@ class ExcitationSignal():
         
         self.amp = amp
         self.eps = eps
+        self.dtype = dtype
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        # separate stream for the common phase of the feasible signals
+        self._offset_rng = self._rng.spawn(1)[0]
 
         self.initialization(self.freq_range, 
                             self.f, 
@@ -53,21 +67,44 @@ class ExcitationSignal():
             f_stamp (array): The frequency stamp.
             idx[0] (int): The index of the start of the frequency range in the frequency stamp.
             idx[1] (int): The index of the end of the frequency range in the frequency stamp.
+            _U_amp_template (array): The read-only amplitude in the frequency domain.
+            _U_amp_key (tuple): The (N, amp, idx, dtype) the amplitude template is built from.
+            _w_template (array): The read-only weights of the excited range for the phase offset.
+            _w_key (tuple): The (N, idx) the weights are built from.
         """
         self.df = self.get_sampling_interval(f, N)
         self.T = self.get_total_time(self.df)
         self.t_stamp = self.get_time_stamp(f, N)
         self.f_stamp = self.get_freq_stamp(f, N)
-        self.idx = self.get_freq_index(freq_range, self.f_stamp)
+        self.idx = self.get_freq_index(freq_range, f, N)
+        self._check_freq_index(N, self.idx)
+        self._U_amp_template = self._get_frequency_amplitude(N, self.amp, self.idx, self.dtype)
+        self._U_amp_template.setflags(write=False)
+        self._U_amp_key = (N, self.amp, self.idx, self.dtype)
+        self._w_template = self._get_phase_weights(N, self.idx)
+        self._w_template.setflags(write=False)
+        self._w_key = (N, self.idx)
     
     @staticmethod
     def get_freq_index(freq_range: tuple,
-                       f_stamp: np.ndarray) -> tuple:
+                       f: float,
+                       N: int) -> tuple:
         """Get the indices of the start and end
-        frequencies in the stamp.
-        """        
-        return (np.where(f_stamp == freq_range[0])[0][0], 
-                np.where(f_stamp == freq_range[1])[0][0])
+        frequencies in the stamp. Since f_i = i*(f/N),
+        the index is the nearest integer of freq*N/f.
+        """
+        return (int(round(freq_range[0] * N / f)), 
+                int(round(freq_range[1] * N / f)))
+
+    @staticmethod
+    def _check_freq_index(N: int,
+                          idx: tuple) -> None:
+        """Check that the excited frequency range lies 
+        strictly below the Nyquist frequency f/2, which is
+        required for the inverse real transformation.
+        """
+        if idx[0] < 0 or idx[0] > idx[1] or 2 * idx[1] >= N:
+            raise ValueError("The excited frequency range must satisfy 0 <= start <= end < f/2 (Nyquist).")
 
     @staticmethod
     def get_freq_stamp(f: float, 
@@ -114,11 +151,12 @@ class ExcitationSignal():
     @staticmethod
     def _get_frequency_amplitude(N: int, 
                                  amp: float, 
-                                 idx: tuple) -> np.ndarray:
+                                 idx: tuple,
+                                 dtype: type=np.float64) -> np.ndarray:
         """Get the amplitude in the frequency domain.
         """
         # initialize frequency domain amplitude (zero array)
-        U_amp = np.zeros(N)
+        U_amp = np.zeros(N, dtype=dtype)
         # assign amplitude to selected frequency range
         idx_vector = np.arange(idx[0], idx[1] + 1)
         U_amp[idx_vector] = amp
@@ -126,78 +164,129 @@ class ExcitationSignal():
         U_amp[0] = 0
         return U_amp
     
-    @staticmethod
-    def _get_random_phase(N: int) -> np.ndarray:
+    def _get_random_phase(self, idx: tuple,
+                          shape: tuple=(),
+                          dtype: type=np.float64) -> np.ndarray:
         """
-        Generate a random phase array: phi \in [0, 2\pi].
+        Generate a random phase array: phi \in [0, 2\pi],
+        only for the excited frequency range.
 
         Args:
-            N (int): Number of points of a signal.
+            idx (tuple): The start and end indices of the excited range.
+            shape (tuple): The leading dimensions of the batch of signals.
+            dtype (type): The floating point precision of the phases.
 
         Returns:
-            phi (array): Random phase values in radians.
+            phi (shape x (idx[1]-idx[0]+1)): Random phase values in radians.
         """
-        return np.random.rand(N) * 2 * np.pi
+        return self._rng.random((*shape, idx[1] - idx[0] + 1), dtype=dtype) * 2 * np.pi
     
     @staticmethod
     def _get_complex_signal(U_amp: np.ndarray,
-                            U_phase: np.ndarray) -> complex:
-        """Generate the complex signal.
+                            U_phase: np.ndarray,
+                            out: np.ndarray=None) -> complex:
+        """Generate the complex signal U_amp * exp(1j * U_phase).
+        The real and imaginary parts are written directly
+        into the output, without temporary arrays.
         """
-        return U_amp * np.exp(1j * U_phase)
+        if out is None:
+            out = np.empty(np.broadcast_shapes(U_amp.shape, U_phase.shape),
+                           dtype=np.result_type(U_phase.dtype, np.complex64))
+        np.cos(U_phase, out=out.real)
+        np.sin(U_phase, out=out.imag)
+        out *= U_amp
+        return out
 
     def get_frequency_signal(self, N: int, 
                              amp: float, 
-                             idx: tuple) -> tuple[complex,
-                                                  np.ndarray,
-                                                  np.ndarray]:
-        """Get one frequency signal with random phase.
+                             idx: tuple,
+                             shape: tuple=()) -> tuple[complex,
+                                                       np.ndarray,
+                                                       np.ndarray]:
+        """Get a batch of frequency signals with random phases.
 
         Args:
             N: the number of points
             amp: the amplitude in the frequency domain
             idx: the start and end indices of the excited range. 
+            shape: the leading dimensions of the batch, () for one signal
         
         Returns:
-            U (complex): The frequency signal.
-            U_amp (array): The amplitude in the frequency domain.
-            U_phase (array): The phase in the frequency domain.
+            U (shape x (idx[1]-idx[0]+1)): The frequency signals in the excited range.
+            U_amp (array): The amplitude in the frequency domain, shared by all signals.
+            U_phase (shape x N): The phase in the frequency domain, zero outside the excited range.
         """
-        U_amp = self._get_frequency_amplitude(N, amp, idx)
-        U_phase = self._get_random_phase(N)
-        U = self._get_complex_signal(U_amp, U_phase)
+        self._check_freq_index(N, idx)
+        if (N, amp, idx, self.dtype) == self._U_amp_key:
+            U_amp = self._U_amp_template
+        else:
+            U_amp = self._get_frequency_amplitude(N, amp, idx, self.dtype)
+        U_phase = np.zeros((*shape, N), dtype=self.dtype)
+        U_phase[..., idx[0]:idx[1] + 1] = self._get_random_phase(idx, shape, self.dtype)
+        U = self._get_complex_signal(U_amp[idx[0]:idx[1] + 1], U_phase[..., idx[0]:idx[1] + 1])
         return U, U_amp, U_phase
 
+    @classmethod
+    def _get_half_spectrum(cls, U_amp: np.ndarray,
+                           U_phase: np.ndarray,
+                           N: int,
+                           idx: tuple) -> complex:
+        """Get the non-negative half of the frequency signals,
+        where only the excited frequency range is nonzero.
+        """
+        U = np.zeros((*U_phase.shape[:-1], N//2 + 1), 
+                     dtype=np.result_type(U_phase.dtype, np.complex64))
+        cls._get_complex_signal(U_amp[..., idx[0]:idx[1] + 1], 
+                                U_phase[..., idx[0]:idx[1] + 1],
+                                out=U[..., idx[0]:idx[1] + 1])
+        return U
+
     @staticmethod
-    def get_time_signal(U: complex):
+    def get_time_signal(U: complex,
+                        N: int,
+                        out: np.ndarray=None) -> np.ndarray:
         """Convert frequency signal to time signal
-        using inverse fast Fourier transformation.
+        using inverse real fast Fourier transformation. Only 
+        the non-negative frequencies (N//2 + 1 points) are 
+        needed, since the time signal is real. A batch of 
+        signals is transformed along the last axis in one call.
 
         Args:
-            U (complex): The frequency signal.
+            U (complex): The non-negative half of the frequency signal.
+            N (int): The number of points of the time signal.
+            out (array): Optional buffer to write the transformation into.
         
         Returns:
             u (array): The corresponding time signal.
         """
-        return np.real(np.fft.ifft(U))
+        return np.fft.irfft(U, n=N, axis=-1, out=out)
 
     @staticmethod
     def _get_normalization(u: np.ndarray) -> np.ndarray:
-        """Normalize the signal wrt the largest abs. value.
+        """Normalize each signal wrt its largest abs. value,
+        in place. The largest abs. value is taken from the max
+        and min reductions, so no abs. copy of u is created.
         """
-        return u/np.max(np.abs(u))
+        u /= np.maximum(u.max(axis=-1, keepdims=True), -u.min(axis=-1, keepdims=True))
+        return u
 
     def get_signals(self, N: int, 
                     amp: int, 
                     nr_inputs: int,
                     idx: tuple,
-                    mode: str) -> tuple[np.ndarray,
-                                        np.ndarray,
-                                        np.ndarray]:
-        """For each input channel, generate one signal
-        according to the mode (orthogonal or random). Ensuring 
-        that the difference between the beginning and the end 
-        of the same signal is not too large (< eps).
+                    mode: str,
+                    shape: tuple=(),
+                    out: tuple=None) -> tuple[np.ndarray,
+                                              np.ndarray,
+                                              np.ndarray]:
+        """For each input channel, generate one signal (or a
+        batch of signals of the given shape) according to the 
+        mode (orthogonal or random). Ensuring that the difference 
+        between the beginning and the end of the same signal is 
+        not too large (< eps). In orthogonal mode, the inputs are
+        circular shifts of one base signal by about i*N/nr_inputs
+        points, moved to the nearest unused start that satisfies eps;
+        a ValueError is raised if there are not enough such starts.
         
         Args:
             N: the number of points.
@@ -205,33 +294,91 @@ class ExcitationSignal():
             nr_inputs: the number of inputs
             idx: the start and end indices
             mode: the way to generate signals for different inputs
+            shape: the batch dimensions after the input channel, e.g. (m,)
+            out: optional arrays (U_amp, U_phase, u) to write the results into
 
         Returns:
-            U_amp (nr_inputs x N): The amplitude in the frequency domain.
-            U_phase (nr_inputs x N): The random phase in the frequency domain.
-            u (nr_inputs x N): The time signal.
+            U_amp (nr_inputs x shape x N): The amplitude in the frequency domain.
+            U_phase (nr_inputs x shape x N): The random phase in the frequency domain.
+            u (nr_inputs x shape x N): The time signal.
         """
-        U_amp = np.zeros((nr_inputs, N))
-        U_phase = np.zeros((nr_inputs, N))
-        u = np.zeros((nr_inputs, N))
+        if mode not in ('orthogonal', 'random'):
+            raise ValueError(f"Unknown mode: {mode}")
+        self._check_freq_index(N, idx)
+        if out is None:
+            out = tuple(np.empty((nr_inputs, *shape, N), dtype=self.dtype) for _ in range(3))
+        U_amp, U_phase, u = out
 
         if mode == 'orthogonal':
-            _U_amp, _U_phase = self.get_one_feasible_signal(N, amp, idx)
-            for i in range(nr_inputs):
-                phase_shift = 2 * np.pi * i / nr_inputs
-                U_amp[i, :] = _U_amp
-                U_phase[i, :] = _U_phase + phase_shift
-                U = self._get_complex_signal(U_amp[i, :], U_phase[i, :])
-                u[i, :] = self._get_normalization(self.get_time_signal(U))
-        
-        elif mode == 'random':
-            for i in range(nr_inputs):
-                U_amp[i, :], U_phase[i, :] = self.get_one_feasible_signal(N, amp, idx)
-                U = self._get_complex_signal(U_amp[i, :], U_phase[i, :])
-                u[i, :] = self._get_normalization(self.get_time_signal(U))
+            # input i is the base signal circularly shifted by about i*N/nr_inputs 
+            # points, i.e. its phases are rotated by a ramp linear in frequency,
+            # so only the base signal has to be transformed
+            _U_amp, _U_phase = self.get_feasible_signals(N, amp, idx, shape)
+            u_0 = u[0]
+            self.get_time_signal(self._get_half_spectrum(_U_amp, _U_phase, N, idx), N, out=u_0)
+            self._get_normalization(u_0)
+            shifts = self._get_feasible_shifts(u_0, nr_inputs, self.eps)
+            n = np.arange(N)
+            for i in range(1, nr_inputs):
+                u[i] = np.take_along_axis(u_0, (n - shifts[i][..., None]) % N, axis=-1)
+
+            k = np.arange(idx[0], idx[1] + 1)
+            ramp = 2 * np.pi * shifts[..., None] * k / N
+            U_phase[..., :idx[0]] = 0
+            U_phase[..., idx[1] + 1:] = 0
+            phase_band = U_phase[..., idx[0]:idx[1] + 1]
+            phase_band[...] = _U_phase[..., idx[0]:idx[1] + 1] - ramp
+            np.mod(phase_band, 2 * np.pi, out=phase_band)
+        else:
+            # draw the phases signal by signal, so that the result
+            # does not depend on how the batch is split
+            _U_amp, _U_phase = self.get_feasible_signals(N, amp, idx, (*shape, nr_inputs))
+            U_phase[...] = np.moveaxis(_U_phase, -2, 0)
+            # all the signals are transformed in one batched call,
+            # only the non-negative frequencies are used for the real signal
+            U = self._get_half_spectrum(_U_amp, U_phase, N, idx)
+            self._get_normalization(self.get_time_signal(U, N, out=u))
 
+        U_amp[...] = _U_amp
         return U_amp, U_phase, u
     
+    @staticmethod
+    def _get_feasible_shifts(u_0: np.ndarray,
+                             nr_inputs: int,
+                             eps: float) -> np.ndarray:
+        """Get the circular shifts of the base signals for all
+        inputs. The shifted signal starts at n = N - shift, so the
+        shift closest to i*N/nr_inputs is chosen among the points 
+        where |u_0[n+1] - u_0[n]| <= eps and that are not used by
+        another input yet. The base signal itself (shift 0) is 
+        always feasible.
+
+        Args:
+            u_0 (shape x N): The normalized base signals.
+            nr_inputs (int): The number of inputs.
+            eps (float): The tolerance.
+
+        Returns:
+            shifts (nr_inputs x shape): The shift of each input in points.
+        """
+        N = u_0.shape[-1]
+        n = np.arange(N)
+        available = np.abs(np.roll(u_0, -1, axis=-1) - u_0) <= eps
+        # the start of the base signal is used by the first input
+        available[..., 0] = False
+        shifts = np.zeros((nr_inputs, *u_0.shape[:-1]), dtype=int)
+        for i in range(1, nr_inputs):
+            start = (N - i * N // nr_inputs) % N
+            dist = np.abs(n - start)
+            dist = np.where(available, np.minimum(dist, N - dist), N)
+            n_start = np.argmin(dist, axis=-1)
+            if np.any(np.take_along_axis(dist, n_start[..., None], axis=-1) == N):
+                raise ValueError(f"The base signal has fewer than {nr_inputs} distinct starts "
+                                 f"satisfying eps, increase eps or N, or reduce nr_inputs.")
+            np.put_along_axis(available, n_start[..., None], False, axis=-1)
+            shifts[i] = (N - n_start) % N
+        return shifts
+
     def get_one_feasible_signal(self,
                                 N: int,
                                 amp: float,
@@ -249,20 +396,97 @@ class ExcitationSignal():
             U_amp: The amplitude in the frequency domain.
             U_phase: The random phase in the frequency domain.
         """
-        diff = 1000.0
-        while diff > self.eps:
-            U, U_amp, U_phase = self.get_frequency_signal(N, amp, idx)
-            u = self._get_normalization(self.get_time_signal(U))
-            diff = np.abs(u[0] - u[1])
+        return self.get_feasible_signals(N, amp, idx, ())
+
+    def get_feasible_signals(self,
+                             N: int,
+                             amp: float,
+                             idx: tuple,
+                             shape: tuple) -> tuple[np.ndarray,
+                                                    np.ndarray]:
+        """Generate a batch of feasible signals, return the 
+        amplitude and phases. The random phases are drawn once. 
+        Signals whose difference between the first two points 
+        may exceed eps times their RMS are rotated by a common 
+        offset to a random common phase for which it does not.
+        Since RMS <= max|u|, the normalized difference is below 
+        eps, usually well below, and no rejection loop is needed.
+
+        Args:
+            N: the number of points
+            amp: the amplitude in the frequency domain
+            idx: the start and end indices
+            shape: the leading dimensions of the batch
+        
+        Returns:
+            U_amp (N): The amplitude in the frequency domain.
+            U_phase (shape x N): The random phases in the frequency domain.
+        """
+        U, U_amp, U_phase = self.get_frequency_signal(N, amp, idx, shape)
+        if (N, idx) == self._w_key:
+            w = self._w_template
+        else:
+            w = self._get_phase_weights(N, idx)
+        phase_band = U_phase[..., idx[0]:idx[1] + 1]
+        r = self._offset_rng.random((*shape, 1))
+        phase_band += self._get_phase_offset(U, w, self.eps, r)
+        np.mod(phase_band, 2 * np.pi, out=phase_band)
         return U_amp, U_phase
 
+    @staticmethod
+    def _get_phase_weights(N: int,
+                           idx: tuple) -> complex:
+        """Get the weights exp(2j*pi*k/N) - 1 of the excited 
+        frequency range, which map a spectrum to the difference 
+        between the first two points of its time signal.
+        """
+        k = np.arange(idx[0], idx[1] + 1)
+        return np.exp(2j * np.pi * k / N) - 1
+
+    @staticmethod
+    def _get_phase_offset(U: complex,
+                          w: complex,
+                          eps: float,
+                          r: np.ndarray) -> np.ndarray:
+        """Get the common phase offset that bounds the difference
+        between the first two points of the normalized time signal:
+        u[1] - u[0] = 2*Re(D)/N, D = sum(U[k] * (exp(2j*pi*k/N) - 1)),
+        and max|u| >= rms(u) = sqrt(2*sum|U[k]|^2)/N, so the signal is
+        feasible if |Re(D)| <= eps*sqrt(2*sum|U[k]|^2)/2. Feasible
+        signals are kept, the others are rotated such that angle(D) 
+        is uniformly distributed over the feasible arcs around +-pi/2.
+        This is rejection sampling of the common phase against the 
+        RMS bound, which is stricter than the test against max|u|.
+        Only the excited range contributes, so no transformation
+        is needed.
+
+        Args:
+            U (complex): The frequency signals in the excited range, along the last axis.
+            w (complex): The weights of the excited range.
+            eps (float): The tolerance of |u[0] - u[1]| relative to the RMS of the signal.
+            r (array): Uniform random numbers in [0, 1), one per signal.
+
+        Returns:
+            phi (array): The phase offset of each signal in radians.
+        """
+        D = np.sum(U * w, axis=-1, keepdims=True)
+        bound = eps * np.sqrt(2 * np.sum(np.abs(U)**2, axis=-1, keepdims=True)) / 2
+        alpha = np.angle(D)
+        feasible = np.abs(D.real) <= bound
+        # half width of the feasible arcs, |cos(angle)| <= bound/|D|
+        delta = np.arcsin(np.minimum(1.0, bound / np.maximum(np.abs(D), np.finfo(float).tiny)))
+        target = np.pi / 2 + (2 * np.mod(2 * r, 1) - 1) * delta + np.pi * np.floor(2 * r)
+        return np.where(feasible, 0.0, target - alpha)
+
     def get_multi_signals(self, m: int, 
                           p: int,
                           nr_inputs: int,
-                          mode: str) -> tuple[np.ndarray,
-                                              np.ndarray,
-                                              np.ndarray,
-                                              np.ndarray]:
+                          mode: str,
+                          n_workers: int=1,
+                          verbose: bool=False) -> tuple[np.ndarray,
+                                                        np.ndarray,
+                                                        np.ndarray,
+                                                        np.ndarray]:
         """For each input channel, generate m different signals, 
         and each signal repeats p times. Each signal is mutually
         orthogonal or totally random.
@@ -272,6 +496,8 @@ class ExcitationSignal():
             p (int): Each signal repeats p times.
             nr_inputs (int): The number of inputs of the system.
             mode (str): The way to generate signals for different inputs, orthogonal or random
+            n_workers (int): The number of processes sharing the m signals.
+            verbose (bool): Whether to show the progress bar.
         
         Returns:
             U_amp (nr_inputs x m x N): The amplitude in the frequency domain of different signals.
@@ -279,20 +505,95 @@ class ExcitationSignal():
             u (nr_inputs x m x N): The different signals in the time domain.
             us (nr_inputs x m*N*p): The m different signals repeated p times.
         """
-        U_amp = np.zeros((nr_inputs, m, self.N))
-        U_phase = np.zeros((nr_inputs, m, self.N))
-        u = np.zeros((nr_inputs, m, self.N))
-        us = np.zeros((nr_inputs, m*p*self.N))
-
-        for i in tqdm(range(m)):
-            U_amp[:, i, :], U_phase[:, i, :], u[:, i, :] = self.get_signals(self.N, 
-                                                                            self.amp, 
-                                                                            nr_inputs,
-                                                                            self.idx,
-                                                                            mode)
-        
+        if n_workers > 1 and m > 0:
+            U_amp, U_phase, u = self._get_parallel_signals(m, nr_inputs, mode, n_workers)
+        else:
+            U_amp, U_phase, u = self._get_tiled_signals(m, nr_inputs, mode, verbose)
         us = self.get_repeat_signals(u, p)
         return U_amp, U_phase, u, us
+
+    def _get_parallel_signals(self, m: int,
+                              nr_inputs: int,
+                              mode: str,
+                              n_workers: int) -> tuple[np.ndarray,
+                                                       np.ndarray,
+                                                       np.ndarray]:
+        """Split the m signals into chunks and generate them
+        in n_workers processes. Each process uses its own 
+        generator spawned from the one of this instance, so the 
+        result is reproducible for a given seed and n_workers.
+        """
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(m), n_workers) if len(chunk) > 0]
+        generators = [ExcitationSignal(freq_range=self.freq_range,
+                                       f=self.f,
+                                       N=self.N,
+                                       amp=self.amp,
+                                       eps=self.eps,
+                                       dtype=self.dtype,
+                                       seed=rng) for rng in self._rng.spawn(len(sizes))]
+        with ProcessPoolExecutor(max_workers=len(sizes)) as executor:
+            results = list(executor.map(ExcitationSignal._get_tiled_signals,
+                                        generators,
+                                        sizes,
+                                        repeat(nr_inputs),
+                                        repeat(mode),
+                                        repeat(False)))
+        U_amp, U_phase, u = (np.concatenate(arrays, axis=1) for arrays in zip(*results))
+        return U_amp, U_phase, u
+
+    def _get_tiled_signals(self, m: int,
+                           nr_inputs: int,
+                           mode: str,
+                           verbose: bool=False) -> tuple[np.ndarray,
+                                                         np.ndarray,
+                                                         np.ndarray]:
+        """Generate m signals for each input channel, tile by
+        tile, each tile fits into the L2 cache.
+        """
+        U_amp = np.empty((nr_inputs, m, self.N), dtype=self.dtype)
+        U_phase = np.empty((nr_inputs, m, self.N), dtype=self.dtype)
+        u = np.empty((nr_inputs, m, self.N), dtype=self.dtype)
+
+        B = self.get_tile_size(nr_inputs, self.N, self.dtype)
+        for i in tqdm(range(0, m, B), 
+                      mininterval=0.5, 
+                      miniters=max(1, m // (100 * B)), 
+                      disable=not verbose):
+            j = min(i + B, m)
+            # the tile is written directly into the outputs
+            self.get_signals(self.N, 
+                             self.amp, 
+                             nr_inputs,
+                             self.idx,
+                             mode,
+                             shape=(j - i,),
+                             out=(U_amp[:, i:j, :], U_phase[:, i:j, :], u[:, i:j, :]))
+        return U_amp, U_phase, u
+
+    @staticmethod
+    def get_tile_size(nr_inputs: int,
+                      N: int,
+                      dtype: type) -> int:
+        """Get the number of signals per input generated at 
+        once, such that the spectra of a tile fit into the L2 cache.
+
+        Args:
+            nr_inputs (int): The number of inputs of the system.
+            N (int): The number of points of a signal.
+            dtype (type): The floating point precision of the signals.
+
+        Returns:
+            B (int): The number of signals per tile.
+        """
+        try:
+            l2_size = os.sysconf('SC_LEVEL2_CACHE_SIZE')
+        except (AttributeError, ValueError, OSError):
+            l2_size = 0
+        if l2_size <= 0:
+            l2_size = L2_CACHE_SIZE
+        # one complex spectrum per signal
+        nbytes = nr_inputs * N * 2 * np.dtype(dtype).itemsize
+        return max(1, l2_size // nbytes)
     
     @staticmethod
     def get_repeat_signals(u: np.ndarray,
@@ -307,7 +608,9 @@ class ExcitationSignal():
             us (nr_inputs x m*p*N): repeated time signal
         """
         nr_inputs, m, N = u.shape
-        us = np.tile(u, (1, 1, p))  # (nr_inputs, m*p, N)
-        return us.reshape(nr_inputs, -1)
+        us = np.empty((nr_inputs, m*p*N), dtype=u.dtype)
+        # write the p copies through a (nr_inputs, m, p, N) view in one pass
+        us.reshape(nr_inputs, m, p, N)[...] = u[:, :, None, :]
+        return us
 
 
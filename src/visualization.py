@@ -32,16 +32,19 @@ class Visualization():
         self.f_stamp = f_stamp
         self.nr_inputs, self.m, self.N = self.U_amp.shape
         self.idx = self.get_freq_index(self.freq_range, 
-                                       self.f_stamp)
+                                       self.f_stamp[1] * self.N,
+                                       self.N)
     
     @staticmethod
     def get_freq_index(freq_range: tuple,
-                       f_stamp: np.ndarray) -> tuple:
+                       f: float,
+                       N: int) -> tuple:
         """Get the indices of the start and end
-        frequencies in the stamp.
-        """        
-        return (np.where(f_stamp == freq_range[0])[0][0], 
-                np.where(f_stamp == freq_range[1])[0][0])
+        frequencies in the stamp. Since f_i = i*(f/N),
+        the index is the nearest integer of freq*N/f.
+        """
+        return (int(round(freq_range[0] * N / f)), 
+                int(round(freq_range[1] * N / f)))
     
     @staticmethod
     def set_axes_format(ax: Axes, x_label: str, y_label: str) -> None:
@@ -82,12 +85,16 @@ class Visualization():
                     self.freq_range[1]*2*np.pi)
         # plot the time signal
         ax = axes[2]
-        ax.axhline(y=1.0, color='black', linestyle='-', linewidth=1.0)
-        ax.axhline(y=-1.0, color='black', linestyle='-', linewidth=1.0)
         self.set_axes_format(ax, r'Time in $s$', r'Time signal')
         self.plot_ax(ax, self.u[idx, self.idx_m, :], self.t_stamp)
-        ax.axhline(y=self.u[idx, self.idx_m, 0], color='red', linestyle='-', linewidth=0.5)
-        ax.axhline(y=self.u[idx, self.idx_m, -1], color='red', linestyle='-', linewidth=0.5)
+        # the bounds and the first/last points as one collection,
+        # spanning the full width of the axes like axhline
+        ax.hlines([1.0, -1.0, self.u[idx, self.idx_m, 0], self.u[idx, self.idx_m, -1]],
+                  xmin=0, xmax=1,
+                  transform=ax.get_yaxis_transform(),
+                  colors=['black', 'black', 'red', 'red'],
+                  linestyles='-',
+                  linewidths=[1.0, 1.0, 0.5, 0.5])
         
     def plot_signals(self, idx_m: int=0) -> None:
         """Plot one signal for all inputs. The first row